@@ -2,6 +2,7 @@
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict
+import numpy as np
 import pandas as pd
 
 
@@ -39,6 +40,43 @@ def _pick_col(df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
     return None
 
 
+def safe_ratio(num: pd.Series, den: pd.Series) -> np.ndarray:
+    """num / den as floats, with 0 wherever den is 0 or either side is missing."""
+    num = num.to_numpy(dtype=float, na_value=np.nan)
+    den = den.to_numpy(dtype=float, na_value=np.nan)
+    ratio = np.divide(num, den, out=np.zeros_like(num), where=den != 0)
+    ratio[np.isnan(ratio)] = 0.0
+    return ratio
+
+
+def week_window(
+    df: pd.DataFrame, week_col: str, week_min: float, week_max: float
+) -> pd.DataFrame:
+    """Rows with week_min <= week <= week_max; binary search when weeks are sorted."""
+    weeks = df[week_col]
+    if weeks.is_monotonic_increasing:
+        lo = weeks.searchsorted(week_min, side="left")
+        hi = weeks.searchsorted(week_max, side="right")
+        return df.iloc[lo:hi]
+    return df[(weeks >= week_min) & (weeks <= week_max)]
+
+
+def _downcast(
+    df: pd.DataFrame, int_cols: Dict[str, type], ratio_cols: List[str]
+) -> None:
+    for col, dtype in int_cols.items():
+        values = df[col]
+        info = np.iinfo(dtype)
+        if (
+            pd.api.types.is_integer_dtype(values)
+            and info.min <= values.min()
+            and values.max() <= info.max
+        ):
+            df[col] = values.astype(dtype)
+    for col in ratio_cols:
+        df[col] = df[col].astype(np.float32)
+
+
 def _read_csv_if_exists(path: Path) -> Optional[pd.DataFrame]:
     if path.exists():
         return pd.read_csv(path)
@@ -126,7 +164,7 @@ def load_hospitalbeds(
 
             staff_counts = (
                 sched[sched[present] == 1]
-                .groupby([wcol, scol])
+                .groupby([wcol, scol], observed=True, sort=False)
                 .size()
                 .reset_index(name="available_staff")
             )
@@ -148,28 +186,37 @@ def load_hospitalbeds(
 
     event_col = _pick_col(weekly, ["event", "events", "special_event"])
 
+    # Service/event are low-cardinality labels that every view groups by and
+    # compares against: store them as categoricals so both run on integer
+    # codes. The categories themselves are Arrow strings when pyarrow exists.
+    for col in (service, event_col):
+        if col:
+            try:
+                weekly[col] = weekly[col].astype("string[pyarrow]")
+            except ImportError:
+                pass
+            weekly[col] = weekly[col].astype("category")
+
     refusal_rate_col = None
     if requests and refusals:
-        denom = weekly[requests].replace(0, float("nan"))
-        weekly["refusal_rate"] = (weekly[refusals] / denom).fillna(0.0)
+        weekly["refusal_rate"] = safe_ratio(weekly[refusals], weekly[requests])
         refusal_rate_col = "refusal_rate"
 
     bed_util_col = None
     if admissions and beds:
-        denom = weekly[beds].replace(0, float("nan"))
-        weekly["bed_utilization"] = (weekly[admissions] / denom).fillna(0.0)
+        weekly["bed_utilization"] = safe_ratio(weekly[admissions], weekly[beds])
         bed_util_col = "bed_utilization"
 
     patients_per_staff_col = None
     if admissions and staff_col_name:
-        denom = weekly[staff_col_name].replace(0, float("nan"))
-        weekly["patients_per_staff"] = (weekly[admissions] / denom).fillna(0.0)
+        weekly["patients_per_staff"] = safe_ratio(
+            weekly[admissions], weekly[staff_col_name]
+        )
         patients_per_staff_col = "patients_per_staff"
 
     demand_level_col = None
     if requests:
-        req_median = weekly[requests].median()
-        req_q75 = weekly[requests].quantile(0.75)
+        req_median, req_q75 = weekly[requests].quantile([0.5, 0.75]).to_numpy()
         weekly["demand_level"] = pd.cut(
             weekly[requests],
             bins=[-1, req_median * 0.5, req_median, req_q75, float("inf")],
@@ -186,6 +233,24 @@ def load_hospitalbeds(
         )
         refusal_level_col = "refusal_level"
 
+    # Counts fit in int32, week numbers in int16, and ratios are only shown to a
+    # few digits, so shrink the bytes every filter/groupby streams through.
+    int_cols = {
+        c: np.int32
+        for c in (requests, admissions, refusals, beds, staff_col_name)
+        if c
+    }
+    int_cols[week] = np.int16
+    _downcast(
+        weekly,
+        int_cols=int_cols,
+        ratio_cols=[
+            c
+            for c in (refusal_rate_col, bed_util_col, patients_per_staff_col)
+            if c
+        ],
+    )
+
     cols = HBCols(
         week=week,
         service=service,
@@ -1,4 +1,5 @@
-from dash import Dash, html, dcc, Input, Output, State
+from dash import Dash, html, dcc, Input, Output, State, callback_context, no_update
+import numpy as np
 import pandas as pd
 
 from .views.menu import make_menu_layout
@@ -7,7 +8,7 @@ from .views.panels import (
     make_diagnostic_timeline,
     make_impact_validation,
 )
-from .data import load_hospitalbeds
+from .data import load_hospitalbeds, safe_ratio, week_window
 
 
 def create_app():
@@ -22,6 +23,9 @@ def create_app():
         events = sorted(df[cols.event].dropna().astype(str).unique().tolist())
     max_week = int(df[cols.week].max()) if cols.week else 52
 
+    service_rows = df.groupby(cols.service, observed=True, sort=False).indices
+    no_rows = np.empty(0, dtype=np.intp)
+
     morale_col = None
     satisfaction_col = None
     for col in df.columns:
@@ -311,8 +315,9 @@ def create_app():
         if cols.refusal_rate:
             return dff[cols.refusal_rate]
         if cols.requests and cols.refusals:
-            denom = dff[cols.requests].replace(0, pd.NA)
-            return (dff[cols.refusals] / denom).fillna(0)
+            return pd.Series(
+                safe_ratio(dff[cols.refusals], dff[cols.requests]), index=dff.index
+            )
         return pd.Series([0] * len(dff))
 
     @app.callback(
@@ -326,8 +331,6 @@ def create_app():
     def update_selection(
         click_data, clear_clicks, service_filter, current_state
     ):
-        from dash import callback_context
-
         if not callback_context.triggered:
             return current_state
 
@@ -445,12 +448,11 @@ def create_app():
         selected_week = state.get("selected_week")
         selected_service = state.get("selected_service")
 
-        dff_heatmap = df.copy()
+        dff_heatmap = df
         if week_range:
-            dff_heatmap = dff_heatmap[
-                (dff_heatmap[cols.week] >= week_range[0])
-                & (dff_heatmap[cols.week] <= week_range[1])
-            ]
+            dff_heatmap = week_window(
+                dff_heatmap, cols.week, week_range[0], week_range[1]
+            )
 
         focus_labels = {
             "refusal_rate": "Refusal Rate",
@@ -478,8 +480,6 @@ def create_app():
         prevent_initial_call=True
     )
     def update_brush_selection(sel_diag, sel_impact, state):
-        from dash import callback_context, no_update
-
         if not callback_context.triggered:
             return no_update
 
@@ -513,14 +513,12 @@ def create_app():
         service_filter = state.get("service_filter", "__ALL__")
         brush_range = state.get("brush_range")
 
-        dff = df.copy()
-        if week_range:
-            dff = dff[
-                (dff[cols.week] >= week_range[0]) & (dff[cols.week] <= week_range[1])
-            ]
-
+        dff = df
         if service_filter and service_filter != "__ALL__":
-            dff = dff[dff[cols.service] == service_filter]
+            dff = df.iloc[service_rows.get(service_filter, no_rows)]
+
+        if week_range:
+            dff = week_window(dff, cols.week, week_range[0], week_range[1])
 
         return make_diagnostic_timeline(
             dff,
@@ -552,14 +550,12 @@ def create_app():
         service_filter = state.get("service_filter", "__ALL__")
         brush_range = state.get("brush_range")
 
-        dff = df.copy()
-        if week_range:
-            dff = dff[
-                (dff[cols.week] >= week_range[0]) & (dff[cols.week] <= week_range[1])
-            ]
-
+        dff = df
         if service_filter and service_filter != "__ALL__":
-            dff = dff[dff[cols.service] == service_filter]
+            dff = df.iloc[service_rows.get(service_filter, no_rows)]
+
+        if week_range:
+            dff = week_window(dff, cols.week, week_range[0], week_range[1])
 
         return make_impact_validation(
             dff,
@@ -1,11 +1,144 @@
 
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
 from typing import Optional, List
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import textwrap
 
+from ..data import week_window
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below run as plain Python
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+_LTTB_THRESHOLD = 1000
+_LTTB_POINTS = 500
+
+
+@njit(cache=True)
+def _lttb(xs, ys, n_out):
+    """Largest-Triangle-Three-Buckets: positions of the points to keep."""
+    n = xs.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[n_out - 1] = n - 1
+    bucket = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket) + 1
+        end = int((i + 1) * bucket) + 1
+        if i == n_out - 3:
+            next_end = n
+        else:
+            next_end = min(int((i + 2) * bucket) + 1, n)
+
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(end, next_end):
+            avg_x += xs[j]
+            avg_y += ys[j]
+        avg_x /= next_end - end
+        avg_y /= next_end - end
+
+        best_area = -1.0
+        best = start
+        for j in range(start, end):
+            area = abs(
+                (xs[a] - avg_x) * (ys[j] - ys[a]) - (xs[a] - xs[j]) * (avg_y - ys[a])
+            )
+            if area > best_area:
+                best_area = area
+                best = j
+        keep[i + 1] = best
+        a = best
+    return keep
+
+
+@njit(cache=True)
+def _runs_from_sorted(weeks):
+    """(start, end) pairs of the consecutive-week runs in a sorted array."""
+    n = weeks.shape[0]
+    runs = np.empty((n, 2), dtype=weeks.dtype)
+    if n == 0:
+        return runs
+
+    k = 0
+    runs[0, 0] = weeks[0]
+    for i in range(1, n):
+        if weeks[i] != weeks[i - 1] + 1:
+            runs[k, 1] = weeks[i - 1]
+            k += 1
+            runs[k, 0] = weeks[i]
+    runs[k, 1] = weeks[n - 1]
+    return runs[: k + 1]
+
+
+def _cell_means(
+    rows: np.ndarray, cols: np.ndarray, vals: np.ndarray, shape
+) -> np.ndarray:
+    """Mean of vals per (row, col) cell; cells without data are 0."""
+    n_cells = shape[0] * shape[1]
+    flat = rows * shape[1] + cols
+    present = ~np.isnan(vals)
+
+    # Pre-aggregated grid (exactly one row per cell): place values directly.
+    # n rows covering all n cells is a bijection, so no cell is summed twice.
+    if len(vals) == n_cells and (rows >= 0).all() and (cols >= 0).all():
+        seen = np.zeros(n_cells, dtype=bool)
+        seen[flat] = True
+        if seen.all():
+            mat = np.zeros(n_cells)
+            mat[flat[present]] = vals[present]
+            return mat.reshape(shape)
+
+    valid = (rows >= 0) & (cols >= 0) & present
+    flat = flat[valid]
+    sums = np.bincount(flat, weights=vals[valid], minlength=n_cells).reshape(shape)
+    counts = np.bincount(flat, minlength=n_cells).reshape(shape)
+    return np.divide(sums, counts, out=np.zeros(shape), where=counts > 0)
+
+
+def _weekly_reduce(dff: pd.DataFrame, week_col: str, agg_dict: dict) -> pd.DataFrame:
+    """Per-week sum/mean of the agg_dict columns, NaN-skipping like groupby."""
+    cols = list(agg_dict)
+    if dff.empty:
+        return pd.DataFrame(columns=[week_col, *cols])
+
+    codes, weeks = pd.factorize(dff[week_col], sort=True, use_na_sentinel=False)
+    order = np.argsort(codes, kind="stable")
+    vals = np.ascontiguousarray(dff[cols].to_numpy(dtype=float)[order])
+    starts = np.r_[0, np.flatnonzero(np.diff(codes[order])) + 1]
+
+    present = ~np.isnan(vals)
+    sums = np.add.reduceat(np.where(present, vals, 0.0), starts, axis=0)
+    counts = np.add.reduceat(present, starts, axis=0, dtype=np.int64)
+    means = np.divide(sums, counts, out=np.full_like(sums, np.nan), where=counts > 0)
+
+    is_mean = np.array([agg_dict[c] == "mean" for c in cols])
+    agg = pd.DataFrame(np.where(is_mean, means, sums), columns=cols)
+    agg.insert(0, week_col, np.asarray(weeks))
+    return agg
+
+
+def _line_xy(x: np.ndarray, y: np.ndarray, downsample: bool):
+    if downsample:
+        keep = _lttb(x.astype(float), y.astype(float), _LTTB_POINTS)
+        return x[keep], y[keep]
+    return x, y
+
 
 def wrap_title(text: str, width: int = 38) -> str:
     text = text.replace(" — ", " — ")
@@ -15,8 +148,9 @@ def wrap_title(text: str, width: int = 38) -> str:
     return "<br>".join(lines[:2])
 
 
-def apply_title(fig, title: str, top_margin: int = 140, font_size: int = 16):
-    fig.update_layout(
+@lru_cache(maxsize=64)
+def _title_layout(title: str, top_margin: int, font_size: int) -> dict:
+    return dict(
         title=dict(
             text=title,
             x=0.5,
@@ -28,19 +162,23 @@ def apply_title(fig, title: str, top_margin: int = 140, font_size: int = 16):
         ),
         margin=dict(t=top_margin),
     )
+
+
+def apply_title(fig, title: str, top_margin: int = 140, font_size: int = 16):
+    fig.update_layout(**_title_layout(title, top_margin, font_size))
     return fig
 
 
-def apply_standard_layout(
-    fig,
+@lru_cache(maxsize=64)
+def _standard_layout(
     title: str,
-    font_size: int = 16,
-    top_margin: int = 110,
-    legend_y: float = 1.08,
-    legend_orientation: str = "h",
-):
-    apply_title(fig, title, top_margin=top_margin, font_size=font_size)
-    fig.update_layout(
+    font_size: int,
+    top_margin: int,
+    legend_y: float,
+    legend_orientation: str,
+) -> dict:
+    return dict(
+        _title_layout(title, top_margin, font_size),
         margin=dict(l=20, r=20, t=top_margin, b=20),
         legend=dict(
             orientation=legend_orientation,
@@ -50,10 +188,46 @@ def apply_standard_layout(
             x=1,
         ),
     )
+
+
+def apply_standard_layout(
+    fig,
+    title: str,
+    font_size: int = 16,
+    top_margin: int = 110,
+    legend_y: float = 1.08,
+    legend_orientation: str = "h",
+):
+    fig.update_layout(
+        **_standard_layout(title, font_size, top_margin, legend_y, legend_orientation)
+    )
     return fig
 
 
 
+_HEATMAP_HOVER = (
+    "<b>%{y}</b><br>"
+    "Week: %{x}<br>"
+    "Value: %{z:.2%}<br>"
+    "<extra>Click to investigate</extra>"
+)
+
+_HEATMAP_LAYOUT = dict(
+    xaxis=dict(title=dict(text="Week")),
+    # Highest-ranked service on top.
+    yaxis=dict(title=dict(text="Service"), autorange="reversed"),
+    showlegend=False,
+    plot_bgcolor="white",
+    coloraxis=dict(
+        colorscale="RdYlBu_r",
+        colorbar=dict(
+            title="Rate",
+            tickformat=".0%",
+        ),
+    ),
+)
+
+
 def make_heatmap_locator(
     df: pd.DataFrame,
     week_col: str,
@@ -64,35 +238,46 @@ def make_heatmap_locator(
     selected_service: Optional[str] = None,
     service_filter: Optional[str] = None,
 ):
-    dff = df[[week_col, service_col]].copy()
-    dff["value"] = values.values
+    service_s = df[service_col]
+    week_s = df[week_col]
+    vals = np.asarray(values, dtype=float)
+    if len(vals) != len(df):
+        raise ValueError(
+            f"values has {len(vals)} entries but the frame has {len(df)} rows"
+        )
 
     if service_filter and service_filter != "__ALL__":
-        dff = dff[dff[service_col] == service_filter]
-
-    pivot = dff.pivot_table(
-        index=service_col,
-        columns=week_col,
-        values="value",
-        aggfunc="mean",
-        fill_value=0,
-    )
-
-    pivot = pivot.reindex(pivot.mean(axis=1).sort_values(ascending=False).index)
-
-    fig = px.imshow(
-        pivot,
-        aspect="auto",
-        color_continuous_scale="RdYlBu_r",
-        labels=dict(x="Week", y="Service", color="Value"),
+        keep = (service_s == service_filter).to_numpy(dtype=bool, na_value=False)
+        service_s, week_s, vals = service_s[keep], week_s[keep], vals[keep]
+
+    svc_codes, services = pd.factorize(service_s, sort=True)
+    wk_codes, weeks = pd.factorize(week_s, sort=True)
+    mat = _cell_means(svc_codes, wk_codes, vals, (len(services), len(weeks)))
+
+    # Rows are services and columns weeks, matching the row-major order Plotly
+    # serializes z in; float32 halves the encoded payload.
+    row_means = mat.mean(axis=1) if mat.size else np.zeros(len(mat))
+    order = np.argsort(-row_means, kind="stable")
+    mat = np.ascontiguousarray(mat[order], dtype=np.float32)
+    services = np.asarray(services)[order]
+    weeks = np.asarray(weeks)
+
+    fig = go.Figure(
+        go.Heatmap(
+            z=mat,
+            x=weeks,
+            y=services,
+            coloraxis="coloraxis",
+            hovertemplate=_HEATMAP_HOVER,
+        )
     )
 
     if selected_week is not None and selected_service is not None:
-        services = list(pivot.index)
-        weeks = list(pivot.columns)
-        if selected_service in services and selected_week in weeks:
-            y_idx = services.index(selected_service)
-            x_idx = weeks.index(selected_week)
+        service_pos = {s: i for i, s in enumerate(services)}
+        week_pos = {w: i for i, w in enumerate(weeks)}
+        y_idx = service_pos.get(selected_service)
+        x_idx = week_pos.get(selected_week)
+        if x_idx is not None and y_idx is not None:
             fig.add_shape(
                 type="rect",
                 x0=x_idx - 0.5,
@@ -110,29 +295,64 @@ def make_heatmap_locator(
             )
 
     apply_standard_layout(fig, title, font_size=16, top_margin=80, legend_y=1.05)
-    fig.update_layout(
-        xaxis_title="Week",
-        yaxis_title="Service",
-        showlegend=False,
-        plot_bgcolor="white",
-        coloraxis_colorbar=dict(
-            title="Rate",
-            tickformat=".0%",
-        ),
-    )
+    fig.update_layout(**_HEATMAP_LAYOUT)
+
+    return fig
 
-    fig.update_traces(
-        hovertemplate=(
-            "<b>%{y}</b><br>"
-            "Week: %{x}<br>"
-            "Value: %{z:.2%}<br>"
-            "<extra>Click to investigate</extra>"
-        )
-    )
 
+def _placeholder_figure(
+    text: str, title: str, height: int, color: str = "#666", hide_axes: bool = True
+) -> go.Figure:
+    fig = go.Figure()
+    fig.add_annotation(
+        text=text,
+        xref="paper",
+        yref="paper",
+        x=0.5,
+        y=0.5,
+        showarrow=False,
+        font=dict(size=14, color=color),
+        align="center",
+    )
+    layout = dict(title=title, showlegend=False, height=height)
+    if hide_axes:
+        layout.update(
+            xaxis=dict(visible=False),
+            yaxis=dict(visible=False),
+            plot_bgcolor="rgba(248,249,250,0.8)",
+        )
+    fig.update_layout(**layout)
     return fig
 
 
+# The placeholder figures never change, so build them once and hand out copies.
+_DIAGNOSTIC_AWAITING = _placeholder_figure(
+    "<b>Select a service-week in the heatmap above</b><br><br>"
+    "This view will show:<br>"
+    "• Patient flow (requests, admitted, refused)<br>"
+    "• Resource constraints (beds, staff)<br>"
+    "• External events (flu, strikes, donations)",
+    "Diagnostic Decomposition — Awaiting Selection",
+    height=900,
+)
+_IMPACT_AWAITING = _placeholder_figure(
+    "<b>Select a service-week in the heatmap</b><br><br>"
+    "This view will show:<br>"
+    "• Staff morale trends<br>"
+    "• Patient satisfaction scores<br>"
+    "• Impact of operational issues",
+    "Impact Validation — Awaiting Selection",
+    height=300,
+)
+_IMPACT_NO_DATA = _placeholder_figure(
+    "No morale/satisfaction data available in dataset",
+    "Impact Validation — No Data",
+    height=300,
+    color="#888",
+    hide_axes=False,
+)
+
+
 def make_diagnostic_timeline(
     df: pd.DataFrame,
     week_col: str,
@@ -155,34 +375,25 @@ def make_diagnostic_timeline(
         visible_events = ["flu", "strike", "donation"]
 
     if selected_service is None:
-        fig = go.Figure()
-        fig.add_annotation(
-            text=(
-                "<b>Select a service-week in the heatmap above</b><br><br>"
-                "This view will show:<br>"
-                "• Patient flow (requests, admitted, refused)<br>"
-                "• Resource constraints (beds, staff)<br>"
-                "• External events (flu, strikes, donations)"
-            ),
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-            font=dict(size=14, color="#666"),
-            align="center",
-        )
-        fig.update_layout(
-            title="Diagnostic Decomposition — Awaiting Selection",
-            xaxis=dict(visible=False),
-            yaxis=dict(visible=False),
-            plot_bgcolor="rgba(248,249,250,0.8)",
-            showlegend=False,
-            height=900,
+        return go.Figure(_DIAGNOSTIC_AWAITING)
+
+    needed = [
+        c
+        for c in (
+            week_col,
+            service_col,
+            requests_col,
+            admitted_col,
+            refused_col,
+            beds_col,
+            staff_col,
+            bed_utilization_col,
+            patients_per_staff_col,
+            event_col,
         )
-        return fig
-
-    dff = df.copy()
+        if c and c in df.columns
+    ]
+    dff = df[list(dict.fromkeys(needed))]
 
     if service_col in dff.columns and selected_service:
         dff = dff[dff[service_col] == selected_service]
@@ -190,7 +401,7 @@ def make_diagnostic_timeline(
     if selected_week is not None:
         week_min = max(1, selected_week - 6)
         week_max = selected_week + 6
-        dff = dff[(dff[week_col] >= week_min) & (dff[week_col] <= week_max)]
+        dff = week_window(dff, week_col, week_min, week_max)
 
     service_display = (
         selected_service.replace("_", " ").title()
@@ -248,105 +459,114 @@ def make_diagnostic_timeline(
     if patients_per_staff_col and patients_per_staff_col in dff.columns:
         agg_dict[patients_per_staff_col] = "mean"
 
-    agg = dff.groupby(week_col, dropna=False).agg(agg_dict).reset_index()
+    if dff[week_col].is_unique:
+        # Already one row per week (single service): aggregation is a no-op
+        # apart from groupby-sum turning missing counts into 0.
+        agg = dff[[week_col, *agg_dict]].sort_values(week_col).reset_index(drop=True)
+        sum_cols = [c for c, how in agg_dict.items() if how == "sum"]
+        if sum_cols:
+            agg[sum_cols] = agg[sum_cols].fillna(0)
+    else:
+        agg = _weekly_reduce(dff, week_col, agg_dict)
+
+    x_arr = agg[week_col].to_numpy()
 
     selected_indices = None
     if highlight_range:
-        selected_indices = agg[
-            (agg[week_col] >= highlight_range[0]) &
-            (agg[week_col] <= highlight_range[1])
-        ].index.tolist()
+        selected_indices = np.flatnonzero(
+            (x_arr >= highlight_range[0]) & (x_arr <= highlight_range[1])
+        ).tolist()
+
+    # Brushing maps selectedpoints onto agg rows, so only thin the overview.
+    downsample = highlight_range is None and len(agg) > _LTTB_THRESHOLD
 
+    traces = []
+    rows = []
+    annotations = []
 
+    admitted_arr = (
+        agg[admitted_col].to_numpy()
+        if admitted_col and admitted_col in agg.columns
+        else None
+    )
 
     if requests_col and requests_col in agg.columns:
-        fig.add_trace(
+        traces.append(
             go.Bar(
-                x=agg[week_col],
-                y=agg[requests_col],
+                x=x_arr,
+                y=agg[requests_col].to_numpy(),
                 name="Requests",
                 marker_color="rgba(52, 152, 219, 0.6)",
                 offsetgroup=0,
                 hovertemplate="Week %{x}<br>Requests: %{y}<extra></extra>",
                 showlegend=False,
-            ),
-            row=1,
-            col=1,
+            )
         )
+        rows.append(1)
 
     if admitted_col and admitted_col in agg.columns:
-        fig.add_trace(
+        traces.append(
             go.Bar(
-                x=agg[week_col],
-                y=agg[admitted_col],
+                x=x_arr,
+                y=admitted_arr,
                 name="Admitted",
                 marker_color="#2ecc71",
                 offsetgroup=1,
                 hovertemplate="Week %{x}<br>Admitted: %{y}<extra></extra>",
                 showlegend=False,
-            ),
-            row=1,
-            col=1,
+            )
         )
+        rows.append(1)
 
     if refused_col and refused_col in agg.columns:
-        fig.add_trace(
+        traces.append(
             go.Bar(
-                x=agg[week_col],
-                y=agg[refused_col],
+                x=x_arr,
+                y=agg[refused_col].to_numpy(),
                 name="Refused",
                 marker_color="#e74c3c",
                 offsetgroup=1,
-                base=agg[admitted_col] if admitted_col in agg.columns else None,
+                base=admitted_arr,
                 hovertemplate="Week %{x}<br>Refused: %{y}<extra></extra>",
                 showlegend=False,
-            ),
-            row=1,
-            col=1,
+            )
         )
+        rows.append(1)
 
     if bed_utilization_col and bed_utilization_col in agg.columns:
         line_width = 3 if diagnostic_focus == "bed_utilization" else 2
         line_color = "#e74c3c" if diagnostic_focus == "bed_utilization" else "#9b59b6"
 
-        fig.add_trace(
+        x, y = _line_xy(x_arr, agg[bed_utilization_col].to_numpy(), downsample)
+        traces.append(
             go.Scatter(
-                x=agg[week_col],
-                y=agg[bed_utilization_col],
+                x=x,
+                y=y,
                 mode="lines+markers",
                 name="Bed Utilization",
                 line=dict(color=line_color, width=line_width),
                 marker=dict(size=8),
                 hovertemplate="Week %{x}<br>Utilization: %{y:.1%}<extra></extra>",
                 showlegend=False,
-            ),
-            row=2,
-            col=1,
+            )
         )
+        rows.append(2)
         if not agg.empty:
-            last_week = agg[week_col].iloc[-1]
-            last_val = agg[bed_utilization_col].iloc[-1]
-            fig.add_annotation(
-                x=last_week,
-                y=last_val,
-                xref="x2",
-                yref="y2",
-                text="<b>Utilization</b>",
-                showarrow=False,
-                xanchor="left",
-                xshift=10,
-                font=dict(size=11, color=line_color),
+            last_week = x[-1]
+            last_val = y[-1]
+            annotations.append(
+                dict(
+                    x=last_week,
+                    y=last_val,
+                    xref="x2",
+                    yref="y2",
+                    text="<b>Utilization</b>",
+                    showarrow=False,
+                    xanchor="left",
+                    xshift=10,
+                    font=dict(size=11, color=line_color),
+                )
             )
-        fig.add_hline(
-            y=0.9,
-            line_dash="dot",
-            line_color="rgba(180, 80, 60, 0.4)",
-            annotation_text="90%",
-            annotation_position="right",
-            annotation_font=dict(size=9, color="rgba(180, 80, 60, 0.7)"),
-            row=2,
-            col=1,
-        )
 
     if staff_col and staff_col in agg.columns:
         line_width = 3 if diagnostic_focus == "patients_per_staff" else 2
@@ -354,33 +574,35 @@ def make_diagnostic_timeline(
             "#e74c3c" if diagnostic_focus == "patients_per_staff" else "#3498db"
         )
 
-        fig.add_trace(
+        x, y = _line_xy(x_arr, agg[staff_col].to_numpy(), downsample)
+        traces.append(
             go.Scatter(
-                x=agg[week_col],
-                y=agg[staff_col],
+                x=x,
+                y=y,
                 mode="lines+markers",
                 name="Staff Available",
                 line=dict(color=line_color, width=line_width),
                 marker=dict(size=8),
                 hovertemplate="Week %{x}<br>Staff: %{y:.0f}<extra></extra>",
                 showlegend=False,
-            ),
-            row=3,
-            col=1,
+            )
         )
+        rows.append(3)
         if not agg.empty:
-            last_week = agg[week_col].iloc[-1]
-            last_val = agg[staff_col].iloc[-1]
-            fig.add_annotation(
-                x=last_week,
-                y=last_val,
-                xref="x3",
-                yref="y3",
-                text="<b>Staff</b>",
-                showarrow=False,
-                xanchor="left",
-                xshift=10,
-                font=dict(size=11, color=line_color),
+            last_week = x[-1]
+            last_val = y[-1]
+            annotations.append(
+                dict(
+                    x=last_week,
+                    y=last_val,
+                    xref="x3",
+                    yref="y3",
+                    text="<b>Staff</b>",
+                    showarrow=False,
+                    xanchor="left",
+                    xshift=10,
+                    font=dict(size=11, color=line_color),
+                )
             )
 
     if patients_per_staff_col and patients_per_staff_col in agg.columns:
@@ -389,33 +611,35 @@ def make_diagnostic_timeline(
             "#e74c3c" if diagnostic_focus == "patients_per_staff" else "#e67e22"
         )
 
-        fig.add_trace(
+        x, y = _line_xy(x_arr, agg[patients_per_staff_col].to_numpy(), downsample)
+        traces.append(
             go.Scatter(
-                x=agg[week_col],
-                y=agg[patients_per_staff_col],
+                x=x,
+                y=y,
                 mode="lines+markers",
                 name="Patients/Staff",
                 line=dict(color=line_color, width=line_width),
                 marker=dict(size=8),
                 hovertemplate="Week %{x}<br>Pts/Staff: %{y:.1f}<extra></extra>",
                 showlegend=False,
-            ),
-            row=4,
-            col=1,
+            )
         )
+        rows.append(4)
         if not agg.empty:
-            last_week = agg[week_col].iloc[-1]
-            last_val = agg[patients_per_staff_col].iloc[-1]
-            fig.add_annotation(
-                x=last_week,
-                y=last_val,
-                xref="x4",
-                yref="y4",
-                text="<b>Pts/Staff</b>",
-                showarrow=False,
-                xanchor="left",
-                xshift=10,
-                font=dict(size=11, color=line_color),
+            last_week = x[-1]
+            last_val = y[-1]
+            annotations.append(
+                dict(
+                    x=last_week,
+                    y=last_val,
+                    xref="x4",
+                    yref="y4",
+                    text="<b>Pts/Staff</b>",
+                    showarrow=False,
+                    xanchor="left",
+                    xshift=10,
+                    font=dict(size=11, color=line_color),
+                )
             )
 
     event_config = {
@@ -425,26 +649,16 @@ def make_diagnostic_timeline(
     }
     strip_height = 0.8 
     if event_col and event_col in dff.columns:
-        event_weeks = dff.groupby([week_col, event_col]).size().reset_index()
+        event_weeks = dff[[week_col, event_col]].drop_duplicates()
 
         for event_type, config in event_config.items():
             if event_type not in visible_events:
                 continue
             event_data = event_weeks[event_weeks[event_col] == event_type]
             if not event_data.empty:
-                weeks_with_event = sorted(event_data[week_col].unique())
-
-                i = 0
-                while i < len(weeks_with_event):
-                    start = weeks_with_event[i]
-                    end = start
-                    while (
-                        i + 1 < len(weeks_with_event)
-                        and weeks_with_event[i + 1] == weeks_with_event[i] + 1
-                    ):
-                        i += 1
-                        end = weeks_with_event[i]
+                weeks_with_event = np.sort(event_data[week_col].unique())
 
+                for start, end in _runs_from_sorted(weeks_with_event):
                     y_base = config["y_base"]
                     
                     shape_opacity = 0.85
@@ -465,7 +679,6 @@ def make_diagnostic_timeline(
                         yref="y5",
                         layer="above",
                     )
-                    i += 1
 
     fig.update_yaxes(
         row=5,
@@ -477,44 +690,65 @@ def make_diagnostic_timeline(
     )
 
     if not agg.empty:
-         fig.add_trace(
+        traces.append(
             go.Scatter(
-                x=agg[week_col],
+                x=x_arr,
                 y=[1.5] * len(agg), 
                 mode="markers",
                 marker=dict(opacity=0, size=0), 
                 showlegend=False,
                 hoverinfo="skip"
-            ),
-            row=5, col=1
+            )
+        )
+        rows.append(5)
+
+    if traces:
+        fig.add_traces(traces, rows=rows, cols=[1] * len(traces))
+
+    if bed_utilization_col and bed_utilization_col in agg.columns:
+        fig.add_hline(
+            y=0.9,
+            line_dash="dot",
+            line_color="rgba(180, 80, 60, 0.4)",
+            annotation_text="90%",
+            annotation_position="right",
+            annotation_font=dict(size=9, color="rgba(180, 80, 60, 0.7)"),
+            row=2,
+            col=1,
         )
 
     if selected_week is not None:
-        for row in range(1, num_rows + 1):
-            fig.add_vline(
+        fig.add_vline(
+            x=selected_week,
+            line_dash="dash",
+            line_color="#2c3e50",
+            line_width=2,
+            row="all",
+            col=1,
+        )
+
+        annotations.append(
+            dict(
                 x=selected_week,
-                line_dash="dash",
-                line_color="#2c3e50",
-                line_width=2,
-                row=row,
-                col=1,
+                y=1.06,  
+                xref="x", 
+                yref="paper",
+                text=f"<b>▼ Week {selected_week}</b>",
+                showarrow=False,
+                xanchor="center", 
+                yanchor="bottom",  
+                align="center",    
+                font=dict(size=10, color="#2c3e50"),
+                bgcolor="rgba(255,255,255,0.95)",
+                bordercolor="#2c3e50",
+                borderwidth=1,
+                borderpad=3,
             )
+        )
 
-        fig.add_annotation(
-            x=selected_week,
-            y=1.06,  
-            xref="x", 
-            yref="paper",
-            text=f"<b>▼ Week {selected_week}</b>",
-            showarrow=False,
-            xanchor="center", 
-            yanchor="bottom",  
-            align="center",    
-            font=dict(size=10, color="#2c3e50"),
-            bgcolor="rgba(255,255,255,0.95)",
-            bordercolor="#2c3e50",
-            borderwidth=1,
-            borderpad=3,
+    if annotations:
+        fig.update_layout(
+            annotations=tuple(fig.layout.annotations) + tuple(annotations)
         )
 
 
@@ -544,8 +778,8 @@ def make_diagnostic_timeline(
     if selected_indices is not None:
     
         if highlight_range and not agg.empty:
-            x_min = agg[week_col].min()
-            x_max = agg[week_col].max()
+            x_min = np.nanmin(x_arr)
+            x_max = np.nanmax(x_arr)
             
             if highlight_range[0] > x_min:
                 fig.add_shape(
@@ -604,34 +838,14 @@ def make_impact_validation(
 ):
     
     if selected_service is None:
-        fig = go.Figure()
-        fig.add_annotation(
-            text=(
-                "<b>Select a service-week in the heatmap</b><br><br>"
-                "This view will show:<br>"
-                "• Staff morale trends<br>"
-                "• Patient satisfaction scores<br>"
-                "• Impact of operational issues"
-            ),
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-            font=dict(size=14, color="#666"),
-            align="center",
-        )
-        fig.update_layout(
-            title="Impact Validation — Awaiting Selection",
-            xaxis=dict(visible=False),
-            yaxis=dict(visible=False),
-            plot_bgcolor="rgba(248,249,250,0.8)",
-            showlegend=False,
-            height=300,
-        )
-        return fig
+        return go.Figure(_IMPACT_AWAITING)
 
-    dff = df.copy()
+    needed = [
+        c
+        for c in (week_col, service_col, morale_col, satisfaction_col)
+        if c and c in df.columns
+    ]
+    dff = df[list(dict.fromkeys(needed))]
 
     if service_col in dff.columns and selected_service:
         dff = dff[dff[service_col] == selected_service]
@@ -639,7 +853,7 @@ def make_impact_validation(
     if selected_week is not None:
         week_min = max(1, selected_week - 6)
         week_max = selected_week + 6
-        dff = dff[(dff[week_col] >= week_min) & (dff[week_col] <= week_max)]
+        dff = week_window(dff, week_col, week_min, week_max)
 
     service_display = (
         selected_service.replace("_", " ").title()
@@ -647,46 +861,51 @@ def make_impact_validation(
         else "All Services"
     )
 
-    agg_dict = {}
-    if morale_col and morale_col in dff.columns:
-        agg_dict[morale_col] = "mean"
-    if satisfaction_col and satisfaction_col in dff.columns:
-        agg_dict[satisfaction_col] = "mean"
-
-    if not agg_dict:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No morale/satisfaction data available in dataset",
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-            font=dict(size=14, color="#888"),
-        )
-        fig.update_layout(
-            title="Impact Validation — No Data",
-            showlegend=False,
-            height=300,
+    score_cols = [
+        c for c in (morale_col, satisfaction_col) if c and c in dff.columns
+    ]
+
+    if not score_cols:
+        return go.Figure(_IMPACT_NO_DATA)
+
+    if dff[week_col].is_unique:
+        agg = dff[[week_col, *score_cols]].sort_values(week_col).reset_index(drop=True)
+    else:
+        agg = (
+            dff.groupby(week_col, dropna=False, observed=True, sort=True)[score_cols]
+            .mean()
+            .reset_index()
         )
-        return fig
 
-    agg = dff.groupby(week_col, dropna=False).agg(agg_dict).reset_index()
+    x_arr = agg[week_col].to_numpy()
 
     selected_indices = None
     if highlight_range:
-        selected_indices = agg[
-            (agg[week_col] >= highlight_range[0]) &
-            (agg[week_col] <= highlight_range[1])
-        ].index.tolist()
+        selected_indices = np.flatnonzero(
+            (x_arr >= highlight_range[0]) & (x_arr <= highlight_range[1])
+        ).tolist()
 
-    fig = go.Figure()
+    score_values = agg[score_cols].to_numpy(dtype=float)
+    score_values = score_values[~np.isnan(score_values)]
+
+    if score_values.size:
+        y_min = score_values.min()
+        y_max = score_values.max()
+        pad = (y_max - y_min) * 0.15 if y_max > y_min else 5
+        y_range = [max(0, y_min - pad), min(100, y_max + pad)]
+    else:
+        y_range = [0, 100]
+
+    downsample = highlight_range is None and len(agg) > _LTTB_THRESHOLD
+    traces = []
 
     if morale_col and morale_col in agg.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=agg[week_col],
-                y=agg[morale_col],
+        x, y = _line_xy(x_arr, agg[morale_col].to_numpy(), downsample)
+        traces.append(
+            dict(
+                type="scatter",
+                x=x,
+                y=y,
                 mode="lines+markers",
                 name="Staff Morale",
                 line=dict(color="#9b59b6", width=3),
@@ -696,10 +915,12 @@ def make_impact_validation(
         )
 
     if satisfaction_col and satisfaction_col in agg.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=agg[week_col],
-                y=agg[satisfaction_col],
+        x, y = _line_xy(x_arr, agg[satisfaction_col].to_numpy(), downsample)
+        traces.append(
+            dict(
+                type="scatter",
+                x=x,
+                y=y,
                 mode="lines+markers",
                 name="Patient Satisfaction",
                 line=dict(color="#3498db", width=3),
@@ -708,19 +929,30 @@ def make_impact_validation(
             )
         )
 
-    all_values: List[float] = []
-    if morale_col and morale_col in agg.columns:
-        all_values.extend(agg[morale_col].dropna().tolist())
-    if satisfaction_col and satisfaction_col in agg.columns:
-        all_values.extend(agg[satisfaction_col].dropna().tolist())
+    title_text = f"Impact Validation — {service_display}"
+    if selected_week:
+        title_text += f" (Week {selected_week} ±6)"
 
-    if all_values:
-        y_min = min(all_values)
-        y_max = max(all_values)
-        pad = (y_max - y_min) * 0.15 if y_max > y_min else 5
-        y_range = [max(0, y_min - pad), min(100, y_max + pad)]
-    else:
-        y_range = [0, 100]
+    layout = dict(
+        title=dict(text=title_text, x=0.5, font=dict(size=16)),
+        xaxis=dict(title=dict(text="Week")),
+        yaxis=dict(title=dict(text="Score (0-100)"), range=y_range),
+        height=320,
+        hovermode="x unified",
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+        ),
+        margin=dict(l=60, r=20, t=80, b=50),
+        plot_bgcolor="white",
+    )
+
+    # Traces and layout are built from known-good literals, so skip Plotly's
+    # per-property validation on this hot callback.
+    fig = go.Figure(data=traces, layout=layout, _validate=False)
 
     if selected_week is not None:
         fig.add_vline(
@@ -758,32 +990,10 @@ def make_impact_validation(
                 annotation_font=dict(size=9, color="#e74c3c"),
             )
 
-    title_text = f"Impact Validation — {service_display}"
-    if selected_week:
-        title_text += f" (Week {selected_week} ±6)"
-
-    fig.update_layout(
-        title=dict(text=title_text, x=0.5, font=dict(size=16)),
-        xaxis_title="Week",
-        yaxis_title="Score (0-100)",
-        yaxis=dict(range=y_range),
-        height=320,
-        hovermode="x unified",
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-        ),
-        margin=dict(l=60, r=20, t=80, b=50),
-        plot_bgcolor="white",
-    )
-
     if selected_indices is not None:
         if highlight_range and not agg.empty:
-            x_min = agg[week_col].min()
-            x_max = agg[week_col].max()
+            x_min = np.nanmin(x_arr)
+            x_max = np.nanmax(x_arr)
             
             if highlight_range[0] > x_min:
                 fig.add_shape(
@@ -830,6 +1040,67 @@ def make_impact_validation(
     return fig
 
 
+_LEGACY_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_LEGACY_CACHE_SIZE = 64
+
+
+def _content_hash(obj) -> bytes:
+    # Digest the whole per-row hash vector: summing it would ignore row order.
+    row_hashes = pd.util.hash_pandas_object(obj, index=True).to_numpy()
+    return hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+
+
+def _frame_key(df: pd.DataFrame, values: Optional[pd.Series] = None) -> tuple:
+    # Fingerprint by content rather than id(df): callbacks hand in freshly
+    # filtered frames, and ids are reused once a frame is garbage collected.
+    return (
+        tuple(df.columns),
+        df.shape,
+        _content_hash(df),
+        _content_hash(values) if values is not None else None,
+    )
+
+
+def _freeze(value):
+    if isinstance(value, (np.ndarray, pd.Series, pd.Index)):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def _figure_payload(fig: go.Figure) -> dict:
+    # Per-object to_plotly_json keeps arrays as ndarrays (Figure.to_dict would
+    # base64-encode them); the _grid_* keys keep make_subplots rows usable.
+    return dict(
+        data=[trace.to_plotly_json() for trace in fig.data],
+        layout=fig.layout.to_plotly_json(),
+        _grid_str=fig._grid_str,
+        _grid_ref=fig._grid_ref,
+    )
+
+
+def _cached_figure(make_key, build):
+    try:
+        key = make_key()
+        cached = _LEGACY_CACHE.get(key)
+    except TypeError:  # an argument we cannot fingerprint; build uncached
+        return build()
+    # Entries are plain property dicts, rebuilt into a fresh go.Figure on
+    # every hit so callers mutating their figure cannot touch the cache.
+    if cached is not None:
+        _LEGACY_CACHE.move_to_end(key)
+        return go.Figure(cached, _validate=False)
+
+    fig = build()
+    _LEGACY_CACHE[key] = _figure_payload(fig)
+    if len(_LEGACY_CACHE) > _LEGACY_CACHE_SIZE:
+        _LEGACY_CACHE.popitem(last=False)
+    return fig
+
+
 def make_heatmap_interactive(
     df: pd.DataFrame,
     week_col: str,
@@ -839,14 +1110,28 @@ def make_heatmap_interactive(
     selected_week: Optional[int] = None,
     selected_service: Optional[str] = None,
 ):
-    return make_heatmap_locator(
-        df=df,
-        week_col=week_col,
-        service_col=service_col,
-        values=values,
-        title=title,
-        selected_week=selected_week,
-        selected_service=selected_service,
+    def key():
+        return (
+            "heatmap",
+            _frame_key(df, values),
+            week_col,
+            service_col,
+            title,
+            selected_week,
+            selected_service,
+        )
+
+    return _cached_figure(
+        key,
+        lambda: make_heatmap_locator(
+            df=df,
+            week_col=week_col,
+            service_col=service_col,
+            values=values,
+            title=title,
+            selected_week=selected_week,
+            selected_service=selected_service,
+        ),
     )
 
 
@@ -864,18 +1149,38 @@ def make_event_timeline(
     service_col: Optional[str] = None,
     **kwargs,
 ):
-    return make_diagnostic_timeline(
-        df=df,
-        week_col=week_col,
-        service_col=service_col or "",
-        admitted_col=admitted_col,
-        refused_col=refused_col,
-        staff_col=staff_col,
-        event_col=event_col,
-        visible_events=visible_events,
-        selected_service=selected_service,
-        selected_week=selected_week,
-        **kwargs,
+    def key():
+        return (
+            "event_timeline",
+            _frame_key(df),
+            week_col,
+            admitted_col,
+            refused_col,
+            staff_col,
+            event_col,
+            title,
+            _freeze(visible_events),
+            selected_service,
+            selected_week,
+            service_col,
+            _freeze(kwargs),
+        )
+
+    return _cached_figure(
+        key,
+        lambda: make_diagnostic_timeline(
+            df=df,
+            week_col=week_col,
+            service_col=service_col or "",
+            admitted_col=admitted_col,
+            refused_col=refused_col,
+            staff_col=staff_col,
+            event_col=event_col,
+            visible_events=visible_events,
+            selected_service=selected_service,
+            selected_week=selected_week,
+            **kwargs,
+        ),
     )
 
 
@@ -889,12 +1194,28 @@ def make_human_cost_timeline(
     selected_week: Optional[int] = None,
     service_col: Optional[str] = None,
 ):
-    return make_impact_validation(
-        df=df,
-        week_col=week_col,
-        service_col=service_col or "",
-        morale_col=morale_col,
-        satisfaction_col=satisfaction_col,
-        selected_service=selected_service,
-        selected_week=selected_week,
+    def key():
+        return (
+            "human_cost_timeline",
+            _frame_key(df),
+            week_col,
+            morale_col,
+            satisfaction_col,
+            title,
+            selected_service,
+            selected_week,
+            service_col,
+        )
+
+    return _cached_figure(
+        key,
+        lambda: make_impact_validation(
+            df=df,
+            week_col=week_col,
+            service_col=service_col or "",
+            morale_col=morale_col,
+            satisfaction_col=satisfaction_col,
+            selected_service=selected_service,
+            selected_week=selected_week,
+        ),
     )
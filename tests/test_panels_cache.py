@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+
+from jbi100_app.views import panels
+
+
+def _frame():
+    weeks = np.repeat(np.arange(1, 5), 3)
+    services = np.tile(["emergency", "ICU", "surgery"], 4)
+    return pd.DataFrame({"week": weeks, "service": services})
+
+
+def test_reordered_values_miss_the_heatmap_cache():
+    panels._LEGACY_CACHE.clear()
+    df = _frame()
+    values = pd.Series(np.linspace(0.0, 1.0, len(df)))
+    reordered = pd.Series(values.to_numpy()[::-1])
+
+    first = panels.make_heatmap_interactive(df, "week", "service", values, "T")
+    second = panels.make_heatmap_interactive(df, "week", "service", reordered, "T")
+    expected = panels.make_heatmap_locator(df, "week", "service", reordered, "T")
+
+    assert len(panels._LEGACY_CACHE) == 2
+    assert not np.array_equal(second.data[0].z, first.data[0].z)
+    np.testing.assert_array_equal(second.data[0].z, expected.data[0].z)